@@ -1,12 +1,23 @@
 import subprocess as _sp
 import dataclasses as _d
+import logging as _l
 import typing as _t
-import itertools as _it
+import contextlib as _cl
 import enum as _e
+import functools as _ft
+import io as _io
 import pathlib as _pl
 import signal as _s
+import sys as _sys
+import tempfile as _tf
 
 _A = _t.TypeVar('_A')
+_DATACLASS_SLOTS = {'slots': True} if _sys.version_info >= (3, 10) else {}
+_log = _l.getLogger(__name__)
+
+_PREFIX_EVAL = ('cue', 'eval')
+_PREFIX_DEF = ('cue', 'def')
+_PREFIX_VET = ('cue', 'vet')
 
 
 @_d.dataclass
@@ -24,17 +35,19 @@ class CalledProcessError(_sp.SubprocessError):
         self.output = proc.stdout
         self.error = proc.stderr
 
-    def __str__(self):
-        if not self.return_code:
-            raise ValueError('Invalid return code 0 for subprocess.')
+    @_ft.cached_property
+    def _return_context(self) -> str:
         if self.return_code < 0:
             try:
-                return_context = f'died with {_s.Signals(-self.return_code)}.'
+                return f'died with {_s.Signals(-self.return_code)}.'
             except ValueError:
-                return_context = f'died with unknown signal {-self.return_code:d}.'
-        else:
-            return_context = f'returned non-zero exit status {self.return_code:d}.'
-        return (f'Subprocess {" ".join(self.args)} {return_context}' +
+                return f'died with unknown signal {-self.return_code:d}.'
+        return f'returned non-zero exit status {self.return_code:d}.'
+
+    def __str__(self):
+        if not self.return_code:
+            raise ValueError('Invalid return code 0 for subprocess.')
+        return (f'Subprocess {" ".join(self.args)} {self._return_context}' +
                 ('' if not self.input else f'\n\tinput:\t{self.input.decode()}') +
                 ('' if not self.error else f'\n\terror:\t{self.error.decode()}') +
                 ('' if not self.output else f'\n\toutput:\t{self.output.decode()}'))
@@ -43,16 +56,17 @@ class CalledProcessError(_sp.SubprocessError):
     def check(proc: _sp.CompletedProcess, input: bytes=b''):
         if proc.returncode != 0:
             e = CalledProcessError(proc, input)
-            print(e)
-            raise CalledProcessError(proc, input)
+            _log.debug('%s', e)  # formatted only if debug logging is enabled
+            raise e
 
 
 def _field_type(field: _d.Field):
-    if getattr(field.type, '__origin__', None) == _t.Union:
-        if field.type.__args__[1] is None:
-            return field.type.__args__[0]
-        else:
-            raise NotImplementedError
+    """The type of `field` once set, i.e. with `Optional` unwrapped."""
+    if _t.get_origin(field.type) is _t.Union:
+        args = tuple(arg for arg in _t.get_args(field.type) if arg is not type(None))
+        if len(args) == 1:
+            return args[0]
+        return _t.Union[args]
     return field.type
 
 
@@ -66,6 +80,104 @@ def _field_name_flag(field: _d.Field):
     return f"--{field.name.rstrip('_').replace('_', '-')}"
 
 
+def _flag_to_args_fn(cls) -> _t.Callable[[_t.Any], list[str]]:
+    """
+    Generate a `to_args` specialised to the fields of `cls`, in the spirit of dataclasses' own codegen.
+
+    Booleans, strings and lists are rendered inline; anything else falls back to `value_to_args`.
+    Flags are frozen, so the rendered arguments are kept on the instance and reused by later calls,
+    unless a value could still change in place (a list) or took the fallback path.
+    """
+    ns = {'value_to_args': cls.value_to_args}
+    lines = ['def to_args(self):',
+             '    try:',
+             '        return list(self._args)',
+             '    except AttributeError:',
+             '        pass',
+             '    out = []',
+             '    cache = True']
+    for i, (name, flag, flag_eq, type_) in enumerate(cls._FLAG_META):
+        ns[f'type_{i}'] = type_
+        ns[f'flag_eq_{i}'] = flag_eq
+        lines.append(f'    v = self.{name}')
+        if type_ is bool:
+            lines += [f'    if v is True:',
+                      f'        out.append({flag!r})',
+                      f'    elif v is not False and v is not None:',
+                      f'        cache = False',
+                      f'        out.extend(value_to_args({flag!r}, type_{i}, v))']
+        else:
+            lines += [f'    if v is not None:',
+                      f'        if isinstance(v, str):',
+                      f'            out.append(flag_eq_{i} + v)',
+                      f'        elif type(v) is list:',
+                      f'            cache = False',
+                      f'            for x in v:',
+                      f'                if type(x) is str:',
+                      f'                    out.append(flag_eq_{i} + x)',
+                      f'                else:',
+                      f'                    out.extend(value_to_args({flag!r}, type_{i}, x))',
+                      f'        else:',
+                      f'            cache = False',
+                      f'            out.extend(value_to_args({flag!r}, type_{i}, v))']
+    lines += ['    if cache:',
+              "        object.__setattr__(self, '_args', tuple(out))",
+              '    return out']
+    exec('\n'.join(lines), ns)
+    fn = ns['to_args']
+    fn.__qualname__ = f'{cls.__qualname__}.to_args'
+    return fn
+
+
+def _own_slots(cls: _t.Type[_A]) -> _t.Type[_A]:
+    """
+    Recreate dataclass `cls` with `__slots__` for the fields its bases do not already slot.
+
+    This is `dataclass(slots=True)` as of Python 3.11; on 3.10 it re-declares every inherited field as a slot.
+    """
+    inherited = {name for base in cls.__mro__[1:] for name in base.__dict__.get('__slots__', ())}
+    slots = tuple(field.name for field in _d.fields(cls) if field.name not in inherited)
+    cls_dict = {key: value for key, value in cls.__dict__.items()
+                if key not in slots and key not in ('__dict__', '__weakref__')}
+    cls_dict['__slots__'] = slots
+    slotted = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
+
+
+def _flag_dataclass(cls: _t.Optional[_t.Type[_A]] = None, /, *, kw_only: bool = False) -> _t.Type[_A]:
+    """
+    Drop-in for `dataclass(frozen=True)` on flag classes.
+
+    Resolves each field's flag name, `--flag=` prefix and (`Optional`-unwrapped) type once, at class creation,
+    into `_FLAG_META`, and installs a `to_args` generated from it.
+    `kw_only` is enforced by wrapping `__init__` where dataclasses lack it (before Python 3.10).
+    """
+    if cls is None:
+        return _ft.partial(_flag_dataclass, kw_only=kw_only)
+    if _sys.version_info < (3, 10):
+        cls = _d.dataclass(cls, frozen=True)
+        if kw_only:
+            init = cls.__init__
+
+            @_ft.wraps(init)
+            def __init__(self, **kwargs):
+                init(self, **kwargs)
+            __init__.__qualname__ = f'{cls.__qualname__}.__init__'
+            cls.__init__ = __init__
+    elif _sys.version_info < (3, 11):
+        cls = _own_slots(_d.dataclass(cls, frozen=True, kw_only=kw_only))
+    else:
+        cls = _d.dataclass(cls, frozen=True, kw_only=kw_only, slots=True)
+    meta = []
+    for field in _d.fields(cls):
+        flag = _field_name_flag(field)
+        meta.append((field.name, flag, _sys.intern(f'{flag}='), _field_type(field)))
+    cls._FLAG_META = tuple(meta)
+    cls.to_args = _flag_to_args_fn(cls)
+    return cls
+
+
 strOpt = _t.Optional[str]
 strListOpt = _t.Optional[_t.Union[str, list[str]]]
 Value = _t.Union[bool,
@@ -73,7 +185,24 @@ Value = _t.Union[bool,
                  strListOpt]
 
 
-@_d.dataclass
+def _list_to_args(flag: str, value: list) -> list[str]:
+    args = []
+    for v in value:
+        if type(v) is str:
+            args.append(f"{flag}={v}")
+        else:  # None is skipped, nested lists flattened, anything else rejected
+            args.extend(Cmd.Flags._Flag.value_to_args(flag, strOpt, v))
+    return args
+
+
+_VALUE_TO_ARGS: dict[type, _t.Callable[[str, _t.Any], list[str]]] = {
+    str: lambda flag, value: [f"{flag}={value}"],
+    list: _list_to_args,
+}
+"""Renderers for non-boolean flag values, keyed on the exact type of the value."""
+
+
+@_d.dataclass(**_DATACLASS_SLOTS)
 class File:
     class Mode(_e.Enum):
         Input = 'input'
@@ -102,14 +231,22 @@ class File:
             return args
 
 
-@_d.dataclass
-class Stdin:
+class _EncodeCache:
+    __slots__ = ('_encoded',)  # (contents, contents.encode()), kept out of the dataclass fields
+
+
+@_d.dataclass(**_DATACLASS_SLOTS)
+class Stdin(_EncodeCache):
     contents: str
     encoding: File.Encodings = File.Encodings.UNSPECIFIED
     path: _t.ClassVar[str] = '-'
 
     def encode(self) -> bytes:
-        return self.contents.encode()
+        # keyed on the contents object so reassigning `contents` invalidates the cache
+        encoded = getattr(self, '_encoded', None)
+        if encoded is None or encoded[0] is not self.contents:
+            encoded = self._encoded = (self.contents, self.contents.encode())
+        return encoded[1]
 
     def to_args(self, mode: File.Mode):
         return File.to_args(self, mode)
@@ -123,34 +260,33 @@ Files = _t.Union[FileStr, list[FileStr]]
 class Cmd:
     class Flags:
         class _Flag:
+            __slots__ = ('_args',)  # to_args cache, filled on first use
+            _FLAG_META: _t.ClassVar[tuple[tuple[str, str, str, type], ...]] = ()
+
+            def __getstate__(self):
+                # fields only, so copies and unpickled flags never carry a stale `_args`
+                return {name: getattr(self, name) for name, *_ in self._FLAG_META}
+
+            def __setstate__(self, state):
+                for name, value in state.items():
+                    object.__setattr__(self, name, value)  # bypass the frozen __setattr__
+
             @staticmethod
             def value_to_args(flag, type_: _t.Type[Value], value: Value) -> list[str]:
                 if type_ is bool and isinstance(value, bool):
                     if value:
                         return [flag]
                     return []
-                if value is not None:  # note: incorrect types will flow through here
-                    if isinstance(value, str):  # and (type_ in {strOpt, strArrayOpt}):
-                        return [f"{flag}={value}"]
-                    if type(value) is list:  # and type_ is list[str]:
-                        return list(_it.chain.from_iterable(Cmd.Flags._Flag.value_to_args(flag, strOpt, v) for v in value))
-                    raise ValueError(f'invalid: {flag}: {type_} = {value}')
-                return []
-
-            @staticmethod
-            def field_to_args(field: _d.Field, value: Value) -> list[str]:
-                flag = _field_name_flag(field)
-                type_ = field.type
-                return Cmd.Flags._Flag.value_to_args(flag, type_, value)
-
-            def to_args(self) -> list[str]:
-                fields: tuple[_d.Field] = _d.fields(self)
-                values = (getattr(self, field.name) for field in fields)
-                return list(
-                    _it.chain.from_iterable(
-                        map(lambda fv: Cmd.Flags._Flag.field_to_args(*fv), zip(fields, values))))
-
-        @_d.dataclass
+                if value is None:
+                    return []
+                to_args = _VALUE_TO_ARGS.get(type(value))  # note: incorrect types will flow through here
+                if to_args is None:
+                    if not isinstance(value, str):
+                        raise ValueError(f'invalid: {flag}: {type_} = {value}')
+                    to_args = _VALUE_TO_ARGS[str]
+                return to_args(flag, value)
+
+        @_flag_dataclass
         class Global(_Flag):
             # todo (ado) help?
             all_errors: bool = False
@@ -166,16 +302,11 @@ class Cmd:
             verbose: bool = False
             """print information about progress"""
 
-        @_d.dataclass
-        class Eval(_Flag):
-            all: bool = False
-            """show optional and hidden fields"""
-            concrete: bool = False
-            """require the evaluation to be concrete"""
-            expression: strListOpt = None
-            """evaluate this expression only"""
+        @_flag_dataclass(kw_only=True)
+        class _CommonFileFlags(_Flag):
+            """Flags shared by eval, def and vet."""
             help: bool = False
-            """help for eval"""
+            """help for the command"""
             inject: strListOpt = None
             """set the value of a tagged field"""
             list_: bool = False
@@ -184,10 +315,6 @@ class Cmd:
             """merge non-CUE files (default true)"""
             name: strOpt = None
             """glob filter for file names"""
-            out: strOpt = None
-            """output format (run 'cue filetypes' for more info)"""
-            outfile: strOpt = None
-            """filename or - for stdout with optional file prefix (run 'cue filetypes' for more info)"""
             package: strOpt = None
             """package name for non-CUE files"""
             path: strListOpt = None
@@ -196,77 +323,49 @@ class Cmd:
             """paths in which to search for imports"""
             schema: strOpt = None
             """expression to select schema for evaluating values in non-CUE files"""
+            with_context: bool = False
+            """import as object with contextual data"""
+
+        @_flag_dataclass(kw_only=True)
+        class Eval(_CommonFileFlags):
+            all: bool = False
+            """show optional and hidden fields"""
+            concrete: bool = False
+            """require the evaluation to be concrete"""
+            expression: strListOpt = None
+            """evaluate this expression only"""
+            out: strOpt = None
+            """output format (run 'cue filetypes' for more info)"""
+            outfile: strOpt = None
+            """filename or - for stdout with optional file prefix (run 'cue filetypes' for more info)"""
             show_attributes: bool = False
             """display field attributes"""
             show_hidden: bool = False
             """display hidden fields"""
             show_optional: bool = False
             """display optional fields"""
-            with_context: bool = False
-            """import as object with contextual data"""
 
-        @_d.dataclass
-        class Def(_Flag):
+        @_flag_dataclass(kw_only=True)
+        class Def(_CommonFileFlags):
             expression: strListOpt = None
             """evaluate this expression only"""
-            help: bool = False
-            """help for eval"""
-            inject: strListOpt = None
-            """set the value of a tagged field"""
-            list_: bool = False
-            """concatenate multiple objects into a list"""
-            merge: bool = False  # todo (ado) defaults True. how does this actually work as a flag? does providing it reverse merge?
-            """merge non-CUE files (default true)"""
-            name: strOpt = None
-            """glob filter for file names"""
             out: strOpt = None
             """output format (run 'cue filetypes' for more info)"""
             outfile: strOpt = None
             """filename or - for stdout with optional file prefix (run 'cue filetypes' for more info)"""
-            package: strOpt = None
-            """package name for non-CUE files"""
-            path: strListOpt = None
-            """CUE expression for single path component"""
-            proto_path: strListOpt = None
-            """paths in which to search for imports"""
-            schema: strOpt = None
-            """expression to select schema for evaluating values in non-CUE files"""
             show_attributes: bool = False
             """display field attributes"""
-            with_context: bool = False
-            """import as object with contextual data"""
 
-        @_d.dataclass
-        class Vet(_Flag):
+        @_flag_dataclass(kw_only=True)
+        class Vet(_CommonFileFlags):
             concrete: bool = False
             """require the evaluation to be concrete"""
-            help: bool = False
-            """help for eval"""
-            inject: strListOpt = None
-            """set the value of a tagged field"""
-            list_: bool = False
-            """concatenate multiple objects into a list"""
-            merge: bool = False  # todo (ado) defaults True. how does this actually work as a flag? does providing it reverse merge?
-            """merge non-CUE files (default true)"""
-            name: strOpt = None
-            """glob filter for file names"""
-            package: strOpt = None
-            """package name for non-CUE files"""
-            path: strListOpt = None
-            """CUE expression for single path component"""
-            proto_path: strListOpt = None
-            """paths in which to search for imports"""
-            schema: strOpt = None
-            """expression to select schema for evaluating values in non-CUE files"""
-            with_context: bool = False
-            """import as object with contextual data"""
 
-        CommandFlags = _t.Union[Eval, Vet]
+        CommandFlags = _t.Union[Eval, Def, Vet]
 
         @staticmethod
         def parse(cmd: _t.Optional[CommandFlags], global_: _t.Optional[Global]) -> list[str]:
-            args = [] if not cmd else cmd.to_args()
-            return args + [] if not global_ else global_.to_args()
+            return ([] if not cmd else cmd.to_args()) + ([] if not global_ else global_.to_args())
 
     @staticmethod
     def parse_file(file: File, mode: File.Mode) -> list[str]:
@@ -278,25 +377,97 @@ class Cmd:
     def parse_files(files: Files, mode: File.Mode) -> list[str]:
         if files:
             if isinstance(files, list):
-                return list(_it.chain.from_iterable((Cmd.parse_file(file, mode) for file in files)))
+                # plain paths are the common case: check the (few) distinct element types rather than every element
+                if not any(issubclass(type_, File) for type_ in set(map(type, files))):
+                    return list(map(str, files))
+                args = []
+                for file in files:
+                    if isinstance(file, File):
+                        args.extend(file.to_args(mode))
+                    else:
+                        args.append(str(file))
+                return args
             return Cmd.parse_file(files, mode)
         return []
 
+    @staticmethod
+    def _run(args: list[str], input: bytes) -> bytes:
+        """
+        Run cue to completion and return its stdout.
+
+        cue has no long-lived server mode for eval/def/vet, so each command is one process.
+        Every buffered command is spawned here; only `cmd_stream`, which hands out the live pipe, spawns its own.
+        """
+        with _sp.Popen(args, stdin=_sp.PIPE, stdout=_sp.PIPE, stderr=_sp.PIPE, bufsize=-1, close_fds=True) as p:
+            output, error = p.communicate(input)
+        if p.returncode:  # only failures pay for the CompletedProcess
+            CalledProcessError.check(_sp.CompletedProcess(args, p.returncode, output, error), input)
+        return output
+
+    @staticmethod
+    def _args(prefix: tuple[str, ...], input: Input = '', files: _t.Optional[Files] = None, *,
+              flags_cmd: _t.Optional[Flags.CommandFlags] = None,
+              flags_global: _t.Optional[Flags.Global] = None) -> list[str]:
+        args = list(prefix)
+        if files:
+            args.extend(Cmd.parse_files(files, File.Mode.Input))
+        if type(input) is str:
+            args.append('-')
+        elif input:
+            args.extend(input.to_args(File.Mode.Input))
+        if flags_cmd:
+            args.extend(flags_cmd.to_args())
+        if flags_global:
+            args.extend(flags_global.to_args())
+        return args
+
+    @staticmethod
+    def _cmd_bytes(prefix: tuple[str, ...], input: Input = '', files: _t.Optional[Files] = None, *,
+                   flags_cmd: _t.Optional[Flags.CommandFlags] = None,
+                   flags_global: _t.Optional[Flags.Global] = None) -> bytes:
+        args = Cmd._args(prefix, input, files, flags_cmd=flags_cmd, flags_global=flags_global)
+        return Cmd._run(args, input.encode())
+
     @staticmethod
     def cmd(cmd: str, input: Input = '', files: _t.Optional[Files] = None, *,
             flags_cmd: _t.Optional[Flags.CommandFlags] = None,
             flags_global: _t.Optional[Flags.Global] = None) -> str:
-        run = _sp.run(['cue', cmd] +
-                      Cmd.parse_files(files, File.Mode.Input) +
-                      (['-'] if (type(input) is str)
-                       else ([] if not input else
-                             input.to_args(File.Mode.Input))) +
-                      Cmd.Flags.parse(flags_cmd, flags_global),
-                      input=input.encode(),
-                      stdout=_sp.PIPE,
-                      stderr=_sp.PIPE)
-        CalledProcessError.check(run, input.encode())
-        return run.stdout.decode()
+        return Cmd._cmd_bytes(('cue', cmd), input, files, flags_cmd=flags_cmd, flags_global=flags_global).decode()
+
+    @staticmethod
+    @_cl.contextmanager
+    def cmd_stream(cmd: str, input: Input = '', files: _t.Optional[Files] = None, *,
+                   flags_cmd: _t.Optional[Flags.CommandFlags] = None,
+                   flags_global: _t.Optional[Flags.Global] = None) -> _t.Iterator[_t.IO[bytes]]:
+        """
+        Run a cue command, yielding its stdout as a pipe to be consumed while cue is still writing.
+
+        Large outputs are never held in memory whole, and can be parsed incrementally.
+        On leaving the block, any unread output is discarded and CalledProcessError raised if cue failed.
+        Closing the pipe early stops cue, which then typically exits with a broken-pipe failure.
+
+        >>> import json
+        >>> with Cmd.cmd_stream('export', 'a: 1') as stdout:
+        ...     json.load(stdout)
+        {'a': 1}
+
+        """
+        args = Cmd._args(('cue', cmd), input, files, flags_cmd=flags_cmd, flags_global=flags_global)
+        data = input.encode()
+        # stderr goes to a file rather than a pipe, so cue can never block on it while stdout is being read
+        with _tf.TemporaryFile() as error, _sp.Popen(args, stdin=_sp.PIPE, stdout=_sp.PIPE, stderr=error) as p:
+            try:
+                p.stdin.write(data)
+                p.stdin.close()
+            except BrokenPipeError:
+                pass  # cue exited without reading its input; its return code says why
+            yield p.stdout
+            if not p.stdout.closed:
+                while p.stdout.read(_io.DEFAULT_BUFFER_SIZE):
+                    pass
+            if p.wait():
+                error.seek(0)
+                CalledProcessError.check(_sp.CompletedProcess(args, p.returncode, b'', error.read()), data)
 
     @staticmethod
     def eval(input: Input = '', files: _t.Optional[Files] = None, *,
@@ -315,19 +486,60 @@ class Cmd:
         "c"
 
         """
-        return Cmd.cmd('eval', input, files, flags_cmd=flags, flags_global=flags_global)
+        return Cmd._cmd_bytes(_PREFIX_EVAL, input, files, flags_cmd=flags, flags_global=flags_global).decode()
+
+    @staticmethod
+    def eval_many(input: Input, expressions: _t.Iterable[str], files: _t.Optional[Files] = None, *,
+                  flags: _t.Optional[Flags.Eval] = None,
+                  flags_global: _t.Optional[Flags.Global] = None) -> str:
+        """
+        eval several expressions against the same configuration in a single cue invocation.
+
+        Any `expression` already set on `flags` is replaced. cue prints the results in order,
+        one after the other, exactly as `eval` with a list of expressions would.
+
+        >>> Cmd.eval_many('a: [ "a", "b", "c" ]', ['a[0]', 'a[2]'])
+        "a"
+        "c"
+
+        """
+        expression = list(expressions)
+        flags = Cmd.Flags.Eval(expression=expression) if flags is None else _d.replace(flags, expression=expression)
+        return Cmd.eval(input, files, flags=flags, flags_global=flags_global)
+
+    @staticmethod
+    def eval_bytes(input: Input = '', files: _t.Optional[Files] = None, *,
+                   flags: _t.Optional[Flags.Eval] = None,
+                   flags_global: _t.Optional[Flags.Global] = None) -> bytes:
+        """eval, returning cue's stdout undecoded, e.g. for parsers that accept bytes."""
+        return Cmd._cmd_bytes(_PREFIX_EVAL, input, files, flags_cmd=flags, flags_global=flags_global)
 
     def def_(input: Input = '', files: _t.Optional[Files] = None, *,
              flags: _t.Optional[Flags.Def] = None,
              flags_global: _t.Optional[Flags.Global] = None) -> str:
-        return Cmd.cmd('def', input, files, flags_cmd=flags, flags_global=flags_global)
+        return Cmd._cmd_bytes(_PREFIX_DEF, input, files, flags_cmd=flags, flags_global=flags_global).decode()
+
+    @staticmethod
+    def def_bytes(input: Input = '', files: _t.Optional[Files] = None, *,
+                  flags: _t.Optional[Flags.Def] = None,
+                  flags_global: _t.Optional[Flags.Global] = None) -> bytes:
+        """def, returning cue's stdout undecoded."""
+        return Cmd._cmd_bytes(_PREFIX_DEF, input, files, flags_cmd=flags, flags_global=flags_global)
 
     @staticmethod
     def vet(input: Input = '',
             files: _t.Optional[Files] = None, *,
             flags: _t.Optional[Flags.Vet] = None,
             flags_global: _t.Optional[Flags.Global] = None):
-        return Cmd.cmd('vet', input, files, flags_cmd=flags, flags_global=flags_global)
+        return Cmd._cmd_bytes(_PREFIX_VET, input, files, flags_cmd=flags, flags_global=flags_global).decode()
+
+    @staticmethod
+    def vet_bytes(input: Input = '',
+                  files: _t.Optional[Files] = None, *,
+                  flags: _t.Optional[Flags.Vet] = None,
+                  flags_global: _t.Optional[Flags.Global] = None) -> bytes:
+        """vet, returning cue's stdout undecoded."""
+        return Cmd._cmd_bytes(_PREFIX_VET, input, files, flags_cmd=flags, flags_global=flags_global)
 
 
 if __name__ == '__main__':